@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 from enum import Enum
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _pkg_version
 
 from homeassistant.util.json import save_json
 from zigpy import types as t
@@ -12,51 +15,65 @@ from zigpy.zcl import foundation as f
 from .params import INTERNAL_PARAMS as p
 from .params import USER_PARAMS as P
 
+try:
+    # Faster JSON parsing/serialisation when available (HA ships it)
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type:ignore[assignment]
+
 LOGGER = logging.getLogger(__name__)
 
-VERSION_TIME: float
-VERSION: str
-MANIFEST: dict[str, str | list[str]]
+# Paths are static for the lifetime of the module - compute them once
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_MANIFEST_PATH = os.path.join(_MODULE_DIR, "manifest.json")
+
+# Output directories already verified/created by _ensure_out_dir
+_VERIFIED_DIRS: set[str] = set()
+
+VERSION: str = "Unknown"
+MANIFEST: dict[str, str | list[str]] = {}
+
+# Cache of manifest reads, keyed by file name.
+# Each entry is an (st_mtime_ns, version, manifest) tuple so the
+# file is only reopened and parsed when its mtime changes.
+_MANIFEST_CACHE: dict[str, tuple[int, str, dict]] = {}
 
 
 def getVersion() -> str:
     # Set name with regards to local path
-    global VERSION_TIME
     global VERSION
     global MANIFEST
 
-    fname = os.path.dirname(__file__) + "/manifest.json"
+    fname = _MANIFEST_PATH
 
-    ftime: float = 0
     try:
-        VERSION_TIME
-    except NameError:
-        VERSION_TIME = 0
+        mtime_ns = os.stat(fname).st_mtime_ns
+    except OSError:
         VERSION = "Unknown"
         MANIFEST = {}
+        return VERSION
 
-    try:
-        ftime = os.path.getmtime(fname)
-        if ftime != ftime:
-            VERSION = "Unknown"
-            MANIFEST = {}
-    except Exception:
-        MANIFEST = {}
+    cached = _MANIFEST_CACHE.get(fname)
+    if cached is not None and cached[0] == mtime_ns:
+        # Unchanged manifest, skip reading it again
+        return cached[1]
+
+    # No version yet, or file change -> read version (again)
+    LOGGER.debug(f"Read version from {fname} mtime_ns:{mtime_ns}")
 
-    if (VERSION is None and ftime != 0) or (ftime != VERSION_TIME):
-        # No version, or file change -> get version again
-        LOGGER.debug(f"Read version from {fname} {ftime}<>{VERSION_TIME}")
+    with open(fname, "rb") as manifest_file:
+        raw = manifest_file.read()
+        MANIFEST = orjson.loads(raw) if orjson else json.loads(raw)
 
-        with open(fname) as f:
-            VERSION_TIME = ftime
-            MANIFEST = json.load(f)
+    VERSION = "Unknown"
+    if MANIFEST is not None:
+        v = MANIFEST.get("version")
+        if v is not None:
+            VERSION = v if isinstance(v, str) else "Invalid manifest"
+            if VERSION == "0.0.0":
+                VERSION = "dev"
 
-        if MANIFEST is not None:
-            if "version" in MANIFEST.keys():
-                v = MANIFEST["version"]
-                VERSION = v if isinstance(v, str) else "Invalid manifest"
-                if VERSION == "0.0.0":
-                    VERSION = "dev"
+    _MANIFEST_CACHE[fname] = (mtime_ns, VERSION, MANIFEST)
 
     return VERSION
 
@@ -64,22 +81,30 @@ def getVersion() -> str:
 # Convert string to int if possible or return original string
 #  (Returning the original string is useful for named attributes)
 def str2int(s):
-    if not type(s) == str:
+    # Dispatch on the first character instead of scanning the
+    # string with startswith/lower for every possible prefix.
+    if type(s) is not str or s == "":
         return s
-    elif s.lower() == "false":
-        return 0
-    elif s.lower() == "true":
-        return 1
-    elif s.startswith("0x") or s.startswith("0X"):
-        return int(s, 16)
-    elif s.startswith("0") and s.isnumeric():
-        return int(s, 8)
-    elif s.startswith("b") and s[1:].isnumeric():
-        return int(s[1:], 2)
-    elif s.isnumeric():
-        return int(s)
-    else:
+    c = s[0]
+    if c == "0":
+        if len(s) > 1 and (s[1] == "x" or s[1] == "X"):
+            return int(s, 16)
+        if s.isnumeric():
+            return int(s, 8)
         return s
+    if c in "123456789":
+        return int(s) if s.isnumeric() else s
+    if c == "b" and s[1:].isnumeric():
+        return int(s[1:], 2)
+    if c in "tTfF":
+        low = s.lower()
+        if low == "true":
+            return 1
+        if low == "false":
+            return 0
+    # Not an int representation (e.g., a named attribute),
+    # except possibly for non-ASCII numerics
+    return int(s) if s.isnumeric() else s
 
 
 # Convert string to best boolean representation
@@ -91,64 +116,143 @@ def str2bool(s):
     return str2int(s) != 0
 
 
+# Cheap truthiness test for boolean service parameters -
+# decides on the raw value without running the str2int ladder
+def _truthy(value):
+    return (
+        value is True
+        or value == 1
+        or (
+            isinstance(value, str)
+            and value.lower() in ("1", "true", "yes", "on")
+        )
+    )
+
+
 class RadioType(Enum):
     UNKNOWN = 0
     ZNP = 1
     EZSP = 2
-    BELLOWS = 2
+    # Previously 2, which made BELLOWS an alias silently collapsing
+    # it with EZSP instead of being a member of its own
+    BELLOWS = 3
 
 
 def isJsonable(x):
-    try:
-        json.dumps(x)
+    # Walk the value instead of serializing it with json.dumps just
+    # to throw the result away - exits on the first non-serializable
+    # element without rendering anything.
+    if x is None or isinstance(x, (str, int, float, bool)):
         return True
-    except (TypeError, OverflowError):
-        return False
+    if isinstance(x, (list, tuple)):
+        return all(isJsonable(item) for item in x)
+    if isinstance(x, dict):
+        # json.dumps also accepts scalar non-string keys (coerced)
+        return all(
+            (key is None or isinstance(key, (str, int, float, bool)))
+            and isJsonable(val)
+            for key, val in x.items()
+        )
+    return False
+
+
+# Radio attribute on the application, matching RadioType and
+# version package - shared by all get_radio* functions
+_RADIO_PROBE_TABLE = (
+    ("_znp", RadioType.ZNP, "zigpy-znp"),
+    ("_ezsp", RadioType.EZSP, "bellows"),
+)
+
+# Sentinel for absent attributes/parameters
+_MISSING = object()
+
+
+def _radio_info(app):
+    # Probe the application once, but only cache the matching
+    # attribute name on the instance: the service dispatcher reloads
+    # this module per call, which recreates the RadioType enum, so a
+    # cached member would be from a previous module generation and
+    # no longer compare equal.  The name string is reload-stable and
+    # is resolved against the current table here.
+    attr_name = getattr(app, "_zt_radio_attr", _MISSING)
+    if attr_name is not _MISSING:
+        for probe_attr, radio_type, pkg in _RADIO_PROBE_TABLE:
+            if probe_attr == attr_name:
+                return (radio_type, getattr(app, probe_attr), pkg)
+        return (RadioType.UNKNOWN, None, None)
+
+    for probe_attr, radio_type, pkg in _RADIO_PROBE_TABLE:
+        radio = getattr(app, probe_attr, _MISSING)
+        if radio is not _MISSING:
+            app._zt_radio_attr = probe_attr
+            return (radio_type, radio, pkg)
+
+    LOGGER.debug("Type recognition for '%s' not implemented", type(app))
+    app._zt_radio_attr = None
+    return (RadioType.UNKNOWN, None, None)
 
 
 def get_radiotype(app):
-    if hasattr(app, "_znp"):
-        return RadioType.ZNP
-    if hasattr(app, "_ezsp"):
-        return RadioType.EZSP
-    LOGGER.debug("Type recognition for '%s' not implemented", type(app))
-    return RadioType.UNKNOWN
+    return _radio_info(app)[0]
 
 
 def get_radio(app):
-    if hasattr(app, "_znp"):
-        return app._znp
-    if hasattr(app, "_ezsp"):
-        return app._ezsp
-    LOGGER.debug("Type recognition for '%s' not implemented", type(app))
-    return RadioType.UNKNOWN
+    radio = _radio_info(app)[1]
+    # Unknown radios historically yield RadioType.UNKNOWN, not None
+    return radio if radio is not None else RadioType.UNKNOWN
+
+
+@functools.lru_cache(maxsize=4)
+def _radio_pkg_version(pkg):
+    # Read the version from the package metadata - avoids importing
+    # the whole radio library just for its version string
+    try:
+        return _pkg_version(pkg)
+    except PackageNotFoundError:
+        return None
 
 
 def get_radio_version(app):
-    if hasattr(app, "_znp"):
-        import zigpy_znp
+    pkg = _radio_info(app)[2]
+    if pkg is None:
+        return None
+    return _radio_pkg_version(pkg)
 
-        return zigpy_znp.__version__
-    if hasattr(app, "_ezsp"):
-        import bellows
 
-        return bellows.__version__
-    LOGGER.debug("Type recognition for '%s' not implemented", type(app))
-    return None
+# Get the entity and device registries, cached on the listener
+# so the async helper chain is only awaited once per gateway.
+async def _get_registries(listener):
+    registries = getattr(listener, "_zt_registries", None)
+    if registries is None:
+        entity_registry = (
+            await listener._hass.helpers.entity_registry.async_get_registry()
+        )
+        device_registry = (
+            await listener._hass.helpers.device_registry.async_get_registry()
+        )
+        registries = (entity_registry, device_registry)
+        listener._zt_registries = registries
+    return registries
 
 
 # Get zigbee IEEE address (EUI64) for the reference.
 #  Reference can be entity, device, or IEEE address
 async def get_ieee(app, listener, ref):
     # LOGGER.debug("Type IEEE: %s", type(ref))
-    if type(ref) == str:
-        # Check if valid ref address
-        if ref.count(":") == 7:
-            return t.EUI64.convert(ref)
+    if type(ref) is str:
+        # Check if valid ref address.  An EUI64 string has a fixed
+        # length ("XX:XX:XX:XX:XX:XX:XX:XX") - testing the length
+        # avoids scanning entity/device ids character by character.
+        if len(ref) == 23 and ref[2] == ":":
+            try:
+                return t.EUI64.convert(ref)
+            except ValueError:
+                # Not an EUI64 after all, try other interpretations
+                pass  # nosec
 
         # Check if network address
         nwk = str2int(ref)
-        if (type(nwk) == int) and nwk >= 0x0000 and nwk <= 0xFFF7:
+        if (type(nwk) is int) and nwk >= 0x0000 and nwk <= 0xFFF7:
             device = app.get_device(nwk=nwk)
             if device is None:
                 return None
@@ -157,9 +261,7 @@ async def get_ieee(app, listener, ref):
                 return device.ieee
 
         # Todo: check if NWK address
-        entity_registry = (
-            await listener._hass.helpers.entity_registry.async_get_registry()
-        )
+        entity_registry, device_registry = await _get_registries(listener)
         # LOGGER.debug("registry %s",entity_registry)
         registry_entity = entity_registry.async_get(ref)
         LOGGER.debug("registry_entity %s", registry_entity)
@@ -169,9 +271,6 @@ async def get_ieee(app, listener, ref):
             LOGGER.error("Not a ZHA device : '%s'", ref)
             return None
 
-        device_registry = (
-            await listener._hass.helpers.device_registry.async_get_registry()
-        )
         registry_device = device_registry.async_get(registry_entity.device_id)
         LOGGER.debug("registry_device %s", registry_device)
         for identifier in registry_device.identifiers:
@@ -201,17 +300,16 @@ def set_state(
         LOGGER.warning("Entity_id '%s' not found", entity_id)
         return
 
-    if stateObj is not None:
-        # Copy existing attributes, to update selected item
-        stateAttrs = stateObj.attributes.copy()
-    else:
-        stateAttrs = {}
-
     # LOGGER.debug("Before: entity:%s key:%s value:%s attrs:%s",
-    #              entity_id, key, value, stateAttrs)
+    #              entity_id, key, value, stateObj)
     if key is not None:
+        # Copy existing attributes, to update selected item
+        stateAttrs = stateObj.attributes.copy() if stateObj else {}
         stateAttrs[key] = value
         value = None
+    else:
+        # Attributes aren't modified, no need to copy them
+        stateAttrs = stateObj.attributes if stateObj else {}
 
     # LOGGER.debug("entity:%s key:%s value:%s attrs:%s",
     #              entity_id, key, value, stateAttrs)
@@ -228,25 +326,23 @@ def set_state(
 
 # Find endpoint matching in_cluster
 def find_endpoint(dev, cluster_id):
-    cnt = 0
     endpoint_id = None
 
-    for key, value in dev.endpoints.items():
-        if key == 0:
-            continue
-        if cluster_id in value.in_clusters:
-            endpoint_id = key
-            cnt = cnt + 1
-
-    if cnt == 0:
-        for key, value in dev.endpoints.items():
-            if key == 0:
-                continue
-            if cluster_id in value.in_clusters:
-                endpoint_id = key
-                cnt = cnt + 1
-
-        if cnt == 0:
+    candidates = [
+        ep_id
+        for ep_id, ep in dev.endpoints.items()
+        if ep_id != 0 and cluster_id in ep.in_clusters
+    ]
+
+    if not candidates:
+        # Not an in_cluster on any endpoint, fall back to out_clusters
+        candidates = [
+            ep_id
+            for ep_id, ep in dev.endpoints.items()
+            if ep_id != 0 and cluster_id in ep.out_clusters
+        ]
+
+        if not candidates:
             LOGGER.error("No Endpoint found for cluster '%s'", cluster_id)
         else:
             LOGGER.error(
@@ -254,12 +350,12 @@ def find_endpoint(dev, cluster_id):
                 cluster_id,
             )
 
-    if cnt > 1:
-        endpoint_id = None
+    if len(candidates) > 1:
         LOGGER.error(
             "More than one Endpoint found for cluster '%s'", cluster_id
         )
-    if cnt == 1:
+    if len(candidates) == 1:
+        endpoint_id = candidates[0]
         LOGGER.debug(
             "Endpoint %s found for cluster '%s'", endpoint_id, cluster_id
         )
@@ -267,83 +363,105 @@ def find_endpoint(dev, cluster_id):
     return endpoint_id
 
 
-def get_cluster_from_params(
-    dev, params: dict[str, int | str | list[int | str]], event_data: dict
-):
+def get_cluster_from_params(dev, params: Params, event_data: dict):
     """
     Get in or outcluster (and endpoint) with best
     correspondence to values provided in params
     """
 
     # Get best endpoint
-    if params[p.EP_ID] is None or params[p.EP_ID] == "":
-        params[p.EP_ID] = find_endpoint(dev, params[p.CLUSTER_ID])
+    if params.endpoint_id is None or params.endpoint_id == "":
+        params.endpoint_id = find_endpoint(dev, params.cluster_id)
 
-    if params[p.EP_ID] not in dev.endpoints:
-        msg = f"Endpoint {params[p.EP_ID]} not found for '{dev.ieee!r}"
+    if params.endpoint_id not in dev.endpoints:
+        msg = f"Endpoint {params.endpoint_id} not found for '{dev.ieee!r}"
         LOGGER.error(msg)
         raise Exception(msg)
 
-    cluster_id = params[p.CLUSTER_ID]
+    cluster_id = params.cluster_id
     if not isinstance(cluster_id, int):
         msg = f"Cluster must be numeric {cluster_id}"
         raise Exception(msg)
 
-    cluster = None
-    if cluster_id not in dev.endpoints[params[p.EP_ID]].in_clusters:
-        msg = "InCluster 0x{:04X} not found for '{}', endpoint {}".format(
-            cluster_id, repr(dev.ieee), params[p.EP_ID]
-        )
-        if cluster_id in dev.enddev.points[params[p.EP_ID]].out_clusters:
-            msg = f'"Using" OutCluster. {msg}'
-            LOGGER.warning(msg)
-            if "warnings" not in event_data:
-                event_data["warnings"] = []
-            event_data["warnings"].append(msg)
-            cluster = dev.endpoints[params[p.EP_ID]].out_clusters[cluster_id]
-        else:
-            LOGGER.error(msg)
-            raise Exception(msg)
-    else:
-        cluster = dev.endpoints[params[p.EP_ID]].in_clusters[cluster_id]
+    endpoint = dev.endpoints[params.endpoint_id]
 
-    return cluster
+    # Common case first: in_cluster hit, no message string to build
+    cluster = endpoint.in_clusters.get(cluster_id)
+    if cluster is not None:
+        return cluster
 
+    msg = "InCluster 0x{:04X} not found for '{}', endpoint {}".format(
+        cluster_id, repr(dev.ieee), params.endpoint_id
+    )
+    cluster = endpoint.out_clusters.get(cluster_id)
+    if cluster is not None:
+        msg = f'"Using" OutCluster. {msg}'
+        LOGGER.warning(msg)
+        if "warnings" not in event_data:
+            event_data["warnings"] = []
+        event_data["warnings"].append(msg)
+        return cluster
 
-def write_json_to_file(data, subdir, fname, desc, listener=None):
+    LOGGER.error(msg)
+    raise Exception(msg)
+
+
+def _ensure_out_dir(subdir, listener=None):
+    """Get (and create if needed) the output directory for subdir.
+
+    Remembers directories already verified so repeated calls skip
+    the os.path.isdir/os.mkdir system calls.
+    """
     if listener is None or subdir == "local":
-        base_dir = os.path.dirname(__file__)
+        base_dir = _MODULE_DIR
     else:
         base_dir = listener._hass.config.config_dir
 
     out_dir = os.path.join(base_dir, subdir)
-    if not os.path.isdir(out_dir):
-        os.mkdir(out_dir)
+    if out_dir not in _VERIFIED_DIRS:
+        if not os.path.isdir(out_dir):
+            os.mkdir(out_dir)
+        _VERIFIED_DIRS.add(out_dir)
 
-    file_name = os.path.join(out_dir, fname)
-    save_json(file_name, data)
-    LOGGER.debug(f"Finished writing {desc} in '{file_name}'")
+    return out_dir
 
 
-def append_to_csvfile(
-    fields, subdir, fname, desc, listener=None, overwrite=False
-):
-    if listener is None or subdir == "local":
-        base_dir = os.path.dirname(__file__)
+def write_json_to_file(data, subdir, fname, desc, listener=None):
+    out_dir = _ensure_out_dir(subdir, listener)
+    file_name = os.path.join(out_dir, fname)
+    if orjson is not None:
+        try:
+            # Serialize directly to bytes, skipping the intermediate
+            # string that the stdlib writer would render
+            serialized = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+            with open(file_name, "wb") as out_file:
+                out_file.write(serialized)
+        except TypeError:
+            # Types orjson can't handle, leave those to save_json
+            save_json(file_name, data)
     else:
-        base_dir = listener._hass.config.config_dir
+        save_json(file_name, data)
+    LOGGER.debug(f"Finished writing {desc} in '{file_name}'")
 
-    out_dir = os.path.join(base_dir, subdir)
-    if not os.path.isdir(out_dir):
-        os.mkdir(out_dir)
 
+def append_rows_to_csvfile(
+    rows, subdir, fname, desc, listener=None, overwrite=False
+):
+    # Write any number of rows with a single open/close so bulk
+    # dumps do not pay the file open cost per row
+    out_dir = _ensure_out_dir(subdir, listener)
     file_name = os.path.join(out_dir, fname)
 
     import csv
 
-    with open(file_name, "w" if overwrite else "a") as f:
-        writer = csv.writer(f)
-        writer.writerow(fields)
+    with open(
+        file_name, "w" if overwrite else "a", newline="", buffering=1 << 16
+    ) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerows(rows)
 
     if overwrite:
         LOGGER.debug(f"Wrote {desc} to '{file_name}'")
@@ -351,6 +469,14 @@ def append_to_csvfile(
         LOGGER.debug(f"Appended {desc} to '{file_name}'")
 
 
+def append_to_csvfile(
+    fields, subdir, fname, desc, listener=None, overwrite=False
+):
+    append_rows_to_csvfile(
+        [fields], subdir, fname, desc, listener=listener, overwrite=overwrite
+    )
+
+
 def get_attr_id(cluster, attribute):
     # Try to get attribute id from cluster
     try:
@@ -363,79 +489,71 @@ def get_attr_id(cluster, attribute):
     return str2int(attribute)
 
 
+# Reverse map python type -> ZCL data type id, precomputed so the
+# hot path is a dict lookup instead of iterating DATA_TYPES.
+# Guarded against zigpy table layout changes.
+try:
+    _PYTYPE_TO_DTID: dict | None = {
+        entry[1]: dtid for dtid, entry in f.DATA_TYPES.items()
+    }
+except Exception:  # nosec
+    _PYTYPE_TO_DTID = None
+
+
 def get_attr_type(cluster, attr_id):
     """Get type for attribute in cluster, or None if not found"""
     try:
-        return f.DATA_TYPES.pytype_to_datatype_id(
-            cluster.attributes.get(attr_id, (None, f.Unknown))[1]
-        )
+        pytype = cluster.attributes.get(attr_id, (None, f.Unknown))[1]
+        if _PYTYPE_TO_DTID is not None:
+            dtid = _PYTYPE_TO_DTID.get(pytype)
+            if dtid is not None:
+                return dtid
+        # Fall back for types not matched exactly (e.g. subclasses)
+        return f.DATA_TYPES.pytype_to_datatype_id(pytype)
     except Exception:  # nosec
         pass
 
     return None
 
 
+# Zigpy type for each simple ZCL attribute type, used by attr_encode.
+# Static mapping, built once so encoding is a single dict lookup
+# instead of a long if/elif chain.
+_ATTR_TYPE_MAP: dict[int, type] = {
+    0x10: t.Bool,
+    0x20: t.uint8_t,
+    0x21: t.uint16_t,
+    0x22: t.uint24_t,
+    0x23: t.uint32_t,
+    0x24: t.uint32_t,
+    0x25: t.uint48_t,
+    0x26: t.uint56_t,
+    0x27: t.uint64_t,
+    0x28: t.int8s,
+    0x29: t.int16s,
+    0x2A: t.int24s,
+    0x2B: t.int32s,
+    0x2C: t.int32s,
+    0x2D: t.int48s,
+    0x2E: t.int56s,
+    0x2F: t.int64s,
+}
+
+
 def attr_encode(attr_val_in, attr_type):  # noqa C901
     # Convert attribute value (provided as a string)
     # to appropriate attribute value.
     # If the attr_type is not set, only read the attribute.
     attr_obj = None
-    if attr_type == 0x10:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.Bool(compare_val))
-    elif attr_type == 0x20:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint8_t(compare_val))
-    elif attr_type == 0x21:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint16_t(compare_val))
-    elif attr_type == 0x22:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint24_t(compare_val))
-    elif attr_type == 0x23:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint32_t(compare_val))
-    elif attr_type == 0x24:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint32_t(compare_val))
-    elif attr_type == 0x25:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint48_t(compare_val))
-    elif attr_type == 0x26:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint56_t(compare_val))
-    elif attr_type == 0x27:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.uint64_t(compare_val))
-    elif attr_type == 0x28:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int8s(compare_val))
-    elif attr_type == 0x29:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int16s(compare_val))
-    elif attr_type == 0x2A:
+    ztype = _ATTR_TYPE_MAP.get(attr_type) if attr_type is not None else None
+    if ztype is not None:
         compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int24s(compare_val))
-    elif attr_type == 0x2B:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int32s(compare_val))
-    elif attr_type == 0x2C:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int32s(compare_val))
-    elif attr_type == 0x2D:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int48s(compare_val))
-    elif attr_type == 0x2E:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int56s(compare_val))
-    elif attr_type == 0x2F:
-        compare_val = str2int(attr_val_in)
-        attr_obj = f.TypeValue(attr_type, t.int64s(compare_val))
+        attr_obj = f.TypeValue(attr_type, ztype(compare_val))
     elif attr_type in [0x41, 0x42]:  # Octet string
         # Octet string requires length -> LVBytes
         compare_val = t.LVBytes(attr_val_in)
 
-        if type(attr_val_in) == str:
+        if type(attr_val_in) is str:
             attr_val_in = bytes(attr_val_in, "utf-8")
 
         if isinstance(attr_val_in, list):
@@ -475,6 +593,176 @@ def attr_encode(attr_val_in, attr_type):  # noqa C901
     return attr_obj, msg, compare_val
 
 
+# Default values for all potential parameters, used to initialize
+# the Params container in extractParams.  Only immutable values may
+# appear here - note that p.ARGS defaults to an empty tuple, a fresh
+# list is allocated when the service provides arguments.
+# TODO: Not all parameters are decoded in this function yet
+_PARAMS_DEFAULTS: dict[
+    str, None | int | str | list[int | str] | tuple[int | str, ...] | bytes
+] = {
+    p.CMD_ID: None,
+    p.EP_ID: None,
+    p.CLUSTER_ID: None,
+    p.ATTR_ID: None,
+    p.ATTR_TYPE: None,
+    p.ATTR_VAL: None,
+    p.CODE: None,  # Install code (join with code)
+    p.MIN_INTERVAL: None,
+    p.MAX_INTERVAL: None,
+    p.REPORTABLE_CHANGE: None,
+    p.DIR: 0,
+    p.MANF: None,
+    p.TRIES: 1,
+    p.EXPECT_REPLY: True,
+    p.ARGS: (),
+    p.STATE_ID: None,
+    p.STATE_ATTR: None,
+    p.ALLOW_CREATE: False,
+    p.EVT_SUCCESS: None,
+    p.EVT_FAIL: None,
+    p.EVT_DONE: None,
+    p.FAIL_EXCEPTION: False,
+    p.READ_BEFORE_WRITE: True,
+    p.READ_AFTER_WRITE: True,
+    p.WRITE_IF_EQUAL: False,
+    p.CSV_FILE: None,
+    p.CSV_LABEL: None,
+}
+
+
+class Params:
+    """Decoded service parameters.
+
+    Slot-based container: every access is an attribute load at a
+    fixed offset instead of a dict hash lookup, and the per-call
+    footprint is much smaller than a 27-key dict.  Item access
+    (params[p.EP_ID]) is kept because the internal parameter keys
+    are valid attribute names and existing call sites use it.
+    """
+
+    # Declared per field so mypy can check attribute access; the
+    # slots themselves come from the defaults template, keeping both
+    # aligned with INTERNAL_PARAMS.
+    cmd_id: int | str | None
+    endpoint_id: int | str | None
+    cluster_id: int | str | None
+    attr_id: int | str | list[int | str] | None
+    attr_type: int | str | None
+    attr_val: int | str | list[int | str] | None
+    code: int | str | list[int | str] | None
+    min_interval: int | str | None
+    max_interval: int | str | None
+    reportable_change: int | str | None
+    dir: int | str
+    manf: int | str | bytes | None
+    tries: int | str
+    expect_reply: bool
+    args: list[int | str] | tuple[int | str, ...]
+    state_id: str | None
+    state_attr: str | None
+    allow_create: bool
+    event_success: str | None
+    event_fail: str | None
+    event_done: str | None
+    fail_exception: bool
+    read_before_write: bool
+    read_after_write: bool
+    write_if_equal: bool
+    csvfile: str | None
+    csvlabel: str | None
+
+    __slots__ = tuple(_PARAMS_DEFAULTS)
+
+    def __init__(self):
+        for key, val in _PARAMS_DEFAULTS.items():
+            object.__setattr__(self, key, val)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __repr__(self):
+        return f"Params({self.as_dict()!r})"
+
+    def keys(self):
+        return self.__slots__
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    # The service dispatcher strips a plain dict copy for event_data
+    copy = as_dict
+
+
+# (user key, internal key, converter) triples driving extractParams.
+# A None converter copies the raw value.  Parameters needing special
+# handling (MANF coercion, ARGS conversion) are dealt with explicitly
+# in extractParams.
+_EXTRACT_TABLE = (
+    (P.ENDPOINT, p.EP_ID, str2int),
+    (P.CLUSTER, p.CLUSTER_ID, str2int),
+    (P.ATTRIBUTE, p.ATTR_ID, str2int),
+    (P.ATTR_TYPE, p.ATTR_TYPE, str2int),
+    (P.ATTR_VAL, p.ATTR_VAL, str2int),
+    (P.CODE, p.CODE, str2int),
+    (P.CMD, p.CMD_ID, str2int),
+    (P.DIR, p.DIR, str2int),
+    (P.MANF, p.MANF, str2int),
+    (P.TRIES, p.TRIES, str2int),
+    (P.MIN_INTRVL, p.MIN_INTERVAL, str2int),
+    (P.MAX_INTRVL, p.MAX_INTERVAL, str2int),
+    (P.REPTBLE_CHG, p.REPORTABLE_CHANGE, str2int),
+    (P.STATE_ID, p.STATE_ID, None),
+    (P.STATE_ATTR, p.STATE_ATTR, None),
+    (P.READ_BEFORE_WRITE, p.READ_BEFORE_WRITE, str2bool),
+    (P.READ_AFTER_WRITE, p.READ_AFTER_WRITE, str2bool),
+    (P.WRITE_IF_EQUAL, p.WRITE_IF_EQUAL, str2bool),
+    (P.EXPECT_REPLY, p.EXPECT_REPLY, _truthy),
+    (P.FAIL_EXCEPTION, p.FAIL_EXCEPTION, _truthy),
+    (P.ALLOW_CREATE, p.ALLOW_CREATE, _truthy),
+    (P.EVENT_DONE, p.EVT_DONE, None),
+    (P.EVENT_FAIL, p.EVT_FAIL, None),
+    (P.EVENT_SUCCESS, p.EVT_SUCCESS, None),
+    (P.OUTCSV, p.CSV_FILE, None),
+    (P.CSVLABEL, p.CSV_LABEL, None),
+)
+
+# Parameters accepted by every service (COMMON_SCHEMA) - a
+# specialized extractor must always handle these
+_COMMON_KEYS = frozenset(
+    (
+        P.TRIES,
+        P.EXPECT_REPLY,
+        P.FAIL_EXCEPTION,
+        P.EVENT_DONE,
+        P.EVENT_FAIL,
+        P.EVENT_SUCCESS,
+    )
+)
+
+
+def _convert_args(raw_args):
+    # Convert the command arguments list
+    cmd_args = []
+    for val in raw_args:
+        LOGGER.debug("cmd arg %s", val)
+        lval = str2int(val)
+        if isinstance(lval, list):
+            # Convert list to List of uint8_t
+            lval = t.List[t.uint8_t](map(t.uint8_t, lval))
+            # Convert list to LVList structure
+            # lval = t.LVList(lval)
+        cmd_args.append(lval)
+        LOGGER.debug("cmd converted arg %s", lval)
+    return cmd_args
+
+
 # Common method to extract and convert parameters.
 #
 # Most parameters are similar, this avoids repeating
@@ -482,152 +770,66 @@ def attr_encode(attr_val_in, attr_type):  # noqa C901
 #
 def extractParams(  # noqa: C901
     service,
-) -> dict[str, None | int | str | list[int | str] | bytes]:
+) -> Params:
     rawParams = service.data
 
     LOGGER.debug("Parameters '%s'", rawParams)
 
-    # Potential parameters, initialized to None
-    # TODO: Not all parameters are decoded in this function yet
-    params: dict[str, None | int | str | list[int | str] | bytes] = {
-        p.CMD_ID: None,
-        p.EP_ID: None,
-        p.CLUSTER_ID: None,
-        p.ATTR_ID: None,
-        p.ATTR_TYPE: None,
-        p.ATTR_VAL: None,
-        p.CODE: None,  # Install code (join with code)
-        p.MIN_INTERVAL: None,
-        p.MAX_INTERVAL: None,
-        p.REPORTABLE_CHANGE: None,
-        p.DIR: 0,
-        p.MANF: None,
-        p.TRIES: 1,
-        p.EXPECT_REPLY: True,
-        p.ARGS: [],
-        p.STATE_ID: None,
-        p.STATE_ATTR: None,
-        p.ALLOW_CREATE: False,
-        p.EVT_SUCCESS: None,
-        p.EVT_FAIL: None,
-        p.EVT_DONE: None,
-        p.FAIL_EXCEPTION: False,
-        p.READ_BEFORE_WRITE: True,
-        p.READ_AFTER_WRITE: True,
-        p.WRITE_IF_EQUAL: False,
-        p.CSV_FILE: None,
-        p.CSV_LABEL: None,
-    }
-
-    # Endpoint to send command to
-    if P.ENDPOINT in rawParams:
-        params[p.EP_ID] = str2int(rawParams[P.ENDPOINT])
+    # Potential parameters, initialized to their defaults
+    params = Params()
 
-    # Cluster to send command to
-    if P.CLUSTER in rawParams:
-        params[p.CLUSTER_ID] = str2int(rawParams[P.CLUSTER])
+    # Extract and convert all regular parameters
+    for src, dst, conv in _EXTRACT_TABLE:
+        val = rawParams.get(src, _MISSING)
+        if val is not _MISSING:
+            params[dst] = conv(val) if conv is not None else val
 
-    # Attribute to send command to
-    if P.ATTRIBUTE in rawParams:
-        params[p.ATTR_ID] = str2int(rawParams[P.ATTRIBUTE])
-
-    # Attribute to send command to
-    if P.ATTR_TYPE in rawParams:
-        params[p.ATTR_TYPE] = str2int(rawParams[P.ATTR_TYPE])
-
-    # Attribute to send command to
-    if P.ATTR_VAL in rawParams:
-        params[p.ATTR_VAL] = str2int(rawParams[P.ATTR_VAL])
-
-    # Install code
-    if P.CODE in rawParams:
-        params[p.CODE] = str2int(rawParams[P.CODE])
-
-    # The command to send
-    if P.CMD in rawParams:
-        params[p.CMD_ID] = str2int(rawParams[P.CMD])
-
-    # The direction (to in or out cluster)
-    if P.DIR in rawParams:
-        params[p.DIR] = str2int(rawParams[P.DIR])
-
-    # Get manufacturer
-    if P.MANF in rawParams:
-        params[p.MANF] = str2int(rawParams[P.MANF])
+    # Remaining parameters need individual treatment
 
     manf = params[p.MANF]
     if manf == "" or manf == 0:
         params[p.MANF] = b""  # Not None, force empty manf
 
-    # Get tries
-    if P.TRIES in rawParams:
-        params[p.TRIES] = str2int(rawParams[P.TRIES])
+    if P.ARGS in rawParams:
+        params[p.ARGS] = _convert_args(rawParams[P.ARGS])
 
-    # Get expect_reply
-    if P.EXPECT_REPLY in rawParams:
-        params[p.EXPECT_REPLY] = str2int(rawParams[P.EXPECT_REPLY]) == 0
+    return params
 
-    if P.FAIL_EXCEPTION in rawParams:
-        params[p.FAIL_EXCEPTION] = str2int(rawParams[P.FAIL_EXCEPTION]) == 0
 
-    if P.ARGS in rawParams:
-        cmd_args = []
-        for val in rawParams[P.ARGS]:
-            LOGGER.debug("cmd arg %s", val)
-            lval = str2int(val)
-            if isinstance(lval, list):
-                # Convert list to List of uint8_t
-                lval = t.List[t.uint8_t]([t.uint8_t(i) for i in lval])
-                # Convert list to LVList structure
-                # lval = t.LVList(lval)
-            cmd_args.append(lval)
-            LOGGER.debug("cmd converted arg %s", lval)
-        params[p.ARGS] = cmd_args
-
-    if P.MIN_INTRVL in rawParams:
-        params[p.MIN_INTERVAL] = str2int(rawParams[P.MIN_INTRVL])
-    if P.MAX_INTRVL in rawParams:
-        params[p.MAX_INTERVAL] = str2int(rawParams[P.MAX_INTRVL])
-    if P.REPTBLE_CHG in rawParams:
-        params[p.REPORTABLE_CHANGE] = str2int(rawParams[P.REPTBLE_CHG])
-
-    if P.STATE_ID in rawParams:
-        params[p.STATE_ID] = rawParams[P.STATE_ID]
-
-    if P.STATE_ATTR in rawParams:
-        params[p.STATE_ATTR] = rawParams[P.STATE_ATTR]
-
-    if P.READ_BEFORE_WRITE in rawParams:
-        params[p.READ_BEFORE_WRITE] = str2bool(rawParams[P.READ_BEFORE_WRITE])
-
-    if P.READ_AFTER_WRITE in rawParams:
-        params[p.READ_AFTER_WRITE] = str2bool(rawParams[P.READ_AFTER_WRITE])
-
-    if P.WRITE_IF_EQUAL in rawParams:
-        params[p.WRITE_IF_EQUAL] = str2bool(rawParams[P.WRITE_IF_EQUAL])
-
-    if P.STATE_ATTR in rawParams:
-        params[p.STATE_ATTR] = rawParams[P.STATE_ATTR]
-
-    if P.ALLOW_CREATE in rawParams:
-        allow = str2int(rawParams[P.ALLOW_CREATE])
-        params[p.ALLOW_CREATE] = (allow is not None) and (
-            (allow is True) or (allow == 1)
-        )
+def make_extractor(required_keys: frozenset):
+    """Build an extractor specialized for a known set of user keys.
 
-    if P.EVENT_DONE in rawParams:
-        params[p.EVT_DONE] = rawParams[P.EVENT_DONE]
+    Filters the extraction table down to the parameters the service
+    can actually receive (plus the keys every service accepts), so
+    the hot path skips the rawParams lookups for all other entries.
+    The generic extractParams remains the fallback for services
+    whose parameter set is not known in advance.
+    """
+    keys = frozenset(required_keys) | _COMMON_KEYS
+    table = tuple(entry for entry in _EXTRACT_TABLE if entry[0] in keys)
+    handle_manf = P.MANF in keys
+    handle_args = P.ARGS in keys
 
-    if P.EVENT_FAIL in rawParams:
-        params[p.EVT_FAIL] = rawParams[P.EVENT_FAIL]
+    def extract(service) -> Params:
+        rawParams = service.data
 
-    if P.EVENT_SUCCESS in rawParams:
-        params[p.EVT_SUCCESS] = rawParams[P.EVENT_SUCCESS]
+        LOGGER.debug("Parameters '%s'", rawParams)
 
-    if P.OUTCSV in rawParams:
-        params[p.CSV_FILE] = rawParams[P.OUTCSV]
+        params = Params()
 
-    if P.CSVLABEL in rawParams:
-        params[p.CSV_LABEL] = rawParams[P.CSVLABEL]
+        for src, dst, conv in table:
+            val = rawParams.get(src, _MISSING)
+            if val is not _MISSING:
+                params[dst] = conv(val) if conv is not None else val
 
-    return params
+        if handle_manf:
+            manf = params[p.MANF]
+            if manf == "" or manf == 0:
+                params[p.MANF] = b""  # Not None, force empty manf
+
+        if handle_args and P.ARGS in rawParams:
+            params[p.ARGS] = _convert_args(rawParams[P.ARGS])
+
+        return params
+
+    return extract
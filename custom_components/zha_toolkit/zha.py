@@ -15,7 +15,7 @@ async def zha_devices(
     devices = [device.zha_device_info for device in listener.devices.values()]
     event_data["devices"] = devices
 
-    if params[p.CSV_LABEL] is not None and type(params[p.CSV_LABEL]) == str:
+    if params[p.CSV_LABEL] is not None and type(params[p.CSV_LABEL]) is str:
         try:
             # Lamba function gets column and returns false if None
             # This make compares possible for ints)
@@ -29,7 +29,7 @@ async def zha_devices(
             pass
 
     if params[p.CSV_FILE] is not None:
-        if data is not None and type(data) == list:
+        if data is not None and type(data) is list:
             columns = data
         else:
             columns = [
@@ -64,6 +64,7 @@ async def zha_devices(
             overwrite=True,
         )
 
+        rows: list[list[int | str | None]] = []
         for d in devices:
             fields: list[int | str | None] = []
             for c in columns:
@@ -71,16 +72,19 @@ async def zha_devices(
                     fields.append(None)
                 else:
                     val = d[c]
-                    if c in ["manufacturer", "nwk"] and type(val) == int:
+                    if c in ["manufacturer", "nwk"] and type(val) is int:
                         val = f"0x{val:04X}"
 
                     fields.append(d[c])
 
             LOGGER.debug(f"Device {fields!r}")
-            u.append_to_csvfile(
-                fields,
-                "csv",
-                params[p.CSV_FILE],
-                f"device_dump[{d['ieee']}]",
-                listener=listener,
-            )
+            rows.append(fields)
+
+        # Write all device rows in one go
+        u.append_rows_to_csvfile(
+            rows,
+            "csv",
+            params[p.CSV_FILE],
+            f"device_dump[{len(rows)} devices]",
+            listener=listener,
+        )
@@ -69,7 +69,7 @@ async def znp_restore(
 
     counter_increment = u.str2int(data)
 
-    if type(counter_increment) != int:
+    if type(counter_increment) is not int:
         counter_increment = 2500
 
     counter_increment = t.uint32_t(counter_increment)